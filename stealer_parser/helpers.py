@@ -1,27 +1,66 @@
 """Helper functions."""
 from argparse import ArgumentParser, Namespace
-from dataclasses import asdict, is_dataclass
-from datetime import date, datetime
-from json import JSONEncoder, dumps
 from pathlib import Path
 from typing import Any
 
 import coloredlogs
+import orjson
 from verboselogs import VerboseLogger
 
+from stealer_parser.models import Leak
 
-class EnhancedJSONEncoder(JSONEncoder):
-    """Enhanced JSON encoder for specific classes."""
+# Output files write buffer size (1 MiB) to limit the number of system calls.
+WRITE_BUFFER_SIZE: int = 1 << 20
 
-    def default(self: Any, obj: Any) -> Any:
-        """Handle custom types JSON serialization."""
-        if is_dataclass(obj):
-            return asdict(obj)
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, set):
-            return list(obj)
-        return super().default(obj)
+
+def _fallback(obj: Any) -> Any:
+    """Handle JSON serialization of types orjson doesn't support natively.
+
+    Dataclasses, datetimes and dates are natively serialized by orjson.
+    """
+    if isinstance(obj, set):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def stream_leak_to_file(filepath: Path, leak: Leak) -> None:
+    """Save a leak to a JSON file one system at a time.
+
+    The whole document is never held in memory, only the JSON of a single
+    SystemData. The output is the same as `orjson.dumps(leak, option=
+    orjson.OPT_INDENT_2)`.
+
+    Parameters
+    ----------
+    filepath : pathlib.Path
+        The file to write to.
+    leak : stealer_parser.models.leak.Leak
+        The leak to serialize.
+
+    Raises
+    ------
+    OSError
+        If the file can't be written.
+    orjson.JSONEncodeError
+        If the data can't be serialized.
+
+    """
+    with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as file:
+        file.write(b'{\n  "filename": ')
+        file.write(orjson.dumps(leak.filename))
+        file.write(b',\n  "systems_data": [')
+
+        for index, system_data in enumerate(leak.systems_data):
+            file.write(b",\n    " if index else b"\n    ")
+            # JSON strings can't contain a raw newline so every newline is an
+            # indentation one.
+            file.write(
+                orjson.dumps(
+                    system_data, default=_fallback, option=orjson.OPT_INDENT_2
+                ).replace(b"\n", b"\n    ")
+            )
+
+        file.write(b"\n  ]\n}" if leak.systems_data else b"]\n}")
 
 
 def dump_to_file(
@@ -45,19 +84,25 @@ def dump_to_file(
         if not filepath.parent.exists():
             filepath.parent.mkdir(parents=True)
 
-        if not isinstance(content, str):
-            filepath.write_text(
-                dumps(
-                    content,
-                    ensure_ascii=False,
-                    cls=EnhancedJSONEncoder,
-                    indent=4,
-                )
-            )
+        if isinstance(content, Leak):
+            stream_leak_to_file(filepath, content)
         else:
-            filepath.write_text(content)
+            with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as file:
+                file.write(
+                    content.encode("utf-8")
+                    if isinstance(content, str)
+                    else orjson.dumps(
+                        content, default=_fallback, option=orjson.OPT_INDENT_2
+                    )
+                )
 
-    except (FileNotFoundError, OSError, PermissionError, ValueError) as err:
+    except (
+        FileNotFoundError,
+        OSError,
+        PermissionError,
+        ValueError,
+        orjson.JSONEncodeError,
+    ) as err:
         logger.error(f"Failed to write file to '{str(filepath)}': {err}")
 
     else:
@@ -101,6 +146,15 @@ def parse_options(description: str) -> Namespace:
         default=None,
         help="the output file name (expects a .json)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=1,
+        help="the number of processes parsing the logs, 0 for one per CPU "
+        "(default: 1)",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -112,8 +166,8 @@ def parse_options(description: str) -> Namespace:
 
     args: Namespace = parser.parse_args()
 
-    if not args.outfile:
-        args.outfile = Path(args.filename).with_suffix(".json").name
+    if args.jobs < 0:
+        parser.error("argument -j/--jobs: must be a positive number or 0")
 
     return args
 
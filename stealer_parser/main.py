@@ -14,14 +14,16 @@ from stealer_parser.processing import process_archive
 
 
 def read_archive(
-    buffer: BytesIO, filename: str, password: str | None
+    source: Path | BytesIO, filename: str, password: str | None
 ) -> ArchiveWrapper:
     """Open logs archive and returns a reader object.
 
     Parameters
     ----------
-    buffer : io.BytesIO
-        The opened archive stream.
+    source : pathlib.Path or io.BytesIO
+        The archive path or, if already in memory (e.g. nested archive), its
+        stream. Given a path, the archive is read on demand instead of being
+        loaded in memory.
     filename : str
         The archive filename.
     password : str
@@ -47,13 +49,13 @@ def read_archive(
 
     match Path(filename).suffix:
         case ".rar":
-            archive = RarFile(buffer)
+            archive = RarFile(source)
 
         case ".zip":
-            archive = ZipFile(buffer)
+            archive = ZipFile(source)
 
         case ".7z":
-            archive = SevenZipFile(buffer, password=password)
+            archive = SevenZipFile(source, password=password)
 
         case other_ext:
             raise NotImplementedError(f"{other_ext} not handled.")
@@ -68,14 +70,19 @@ def main() -> None:
         name="StealerParser", verbosity_level=args.verbose
     )
     archive: ArchiveWrapper | None = None
+    filepath = Path(args.filename)
 
     try:
         leak = Leak(filename=args.filename)
 
-        with open(args.filename, "rb") as file_handle:
-            with BytesIO(file_handle.read()) as buffer:
-                archive = read_archive(buffer, args.filename, args.password)
-                process_archive(logger, leak, archive)
+        archive = read_archive(filepath, args.filename, args.password)
+        process_archive(
+            logger,
+            leak,
+            archive,
+            jobs=args.jobs,
+            verbosity_level=args.verbose,
+        )
 
     except (
         FileNotFoundError,
@@ -89,7 +96,11 @@ def main() -> None:
         logger.error(f"Failed parsing {args.filename}: {err}")
 
     else:
-        dump_to_file(logger, args.outfile, leak)
+        dump_to_file(
+            logger,
+            args.outfile or filepath.with_suffix(".json").name,
+            leak,
+        )
 
     finally:
         if archive:
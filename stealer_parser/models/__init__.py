@@ -9,9 +9,11 @@ from .credential import (
 from .leak import Leak, SystemData
 from .system import System
 from .types import (
+    STEALER_NAMES,
     JSONArrayType,
     JSONObjectType,
     JSONType,
     JSONValueType,
     StealerNameType,
+    is_stealer_name,
 )
@@ -1,5 +1,6 @@
 """Wrapper to manipulate several types of archive."""
 import posixpath
+from codecs import BOM_UTF16_BE, BOM_UTF16_LE
 from io import BytesIO
 from pathlib import Path
 from zipfile import ZipFile
@@ -8,6 +9,9 @@ from py7zr import SevenZipFile
 from py7zr.exceptions import CrcError
 from rarfile import RarFile
 
+# Byte order marks of UTF-16 files, which some stealers write on Windows.
+UTF16_BOMS: tuple[bytes, bytes] = (BOM_UTF16_LE, BOM_UTF16_BE)
+
 
 class ArchiveWrapper:
     """Class defining a common interface for RAR, ZIP and 7z files.
@@ -24,6 +28,12 @@ class ArchiveWrapper:
         The archive's password if required.
     _repr : str, optional
         The formatting string for the object's printable representation.
+    _namelist : list of str, optional
+        The archive members names, computed on first call to namelist().
+    _filename : pathlib.Path
+        The complete path, computed once since the member doesn't change.
+    _at_stripped : str
+        The current archive member without trailing slash.
 
     Methods
     -------
@@ -39,6 +49,8 @@ class ArchiveWrapper:
         Return names of the archive members.
     read_file(filename)
         Retrieve an archive file's text content.
+    read_files(filenames)
+        Retrieve several archive files' text content.
 
     """
 
@@ -75,6 +87,7 @@ class ArchiveWrapper:
         self.root: RarFile | ZipFile | SevenZipFile = root
         self.at: str = at
         self.password = password
+        self._namelist: list[str] | None = None
 
         if filename:
             self.root.filename = filename
@@ -85,6 +98,9 @@ class ArchiveWrapper:
         if password and not isinstance(self.root, SevenZipFile):
             self.root.setpassword(bytes(password, encoding="utf-8"))
 
+        self._filename: Path = Path(self.root.filename).joinpath(at)
+        self._at_stripped: str = at.rstrip("/")
+
     def __str__(self) -> str:  # noqa: D105
         return posixpath.join(self.root.filename, self.at)  # type: ignore
 
@@ -96,17 +112,17 @@ class ArchiveWrapper:
     @property
     def name(self) -> str:
         """Return the final path component."""
-        return Path(self.at).name or self.filename.name
+        return self._filename.name
 
     @property
     def filename(self) -> Path:
         """Return the complete path."""
-        return Path(self.root.filename).joinpath(self.at)  # type: ignore
+        return self._filename
 
     # Methods #################################################################
 
     def _is_child(self, path: "ArchiveWrapper") -> bool:
-        return posixpath.dirname(path.at.rstrip("/")) == self.at.rstrip("/")
+        return posixpath.dirname(path._at_stripped) == self._at_stripped
 
     def _next(self, at: str) -> "ArchiveWrapper":
         return self.__class__(self.root, at)
@@ -133,6 +149,8 @@ class ArchiveWrapper:
 
     def close(self) -> None:
         """Close the underlying archive object."""
+        self._namelist = None
+
         if isinstance(self.root, RarFile) and isinstance(
             self.root._rarfile, BytesIO
         ):
@@ -142,17 +160,23 @@ class ArchiveWrapper:
             self.root.close()
 
     def namelist(self) -> list[str]:
-        """Return names of the archive members."""
-        # ZipInfo and RarInfo appends a slash to identify directories from
-        # files. The following code adds it manually for 7z files.
-        if isinstance(self.root, SevenZipFile):
-            return [
-                f"{elem.filename}/" if elem.is_directory else elem.filename
-                for elem in self.root.files
-            ]
+        """Return names of the archive members.
+
+        The list is computed once and must not be modified.
+        """
+        if self._namelist is None:
+            # ZipInfo and RarInfo appends a slash to identify directories from
+            # files. The following code adds it manually for 7z files.
+            if isinstance(self.root, SevenZipFile):
+                self._namelist = [
+                    f"{elem.filename}/" if elem.is_directory else elem.filename
+                    for elem in self.root.files
+                ]
+
+            else:
+                self._namelist = self.root.namelist()
 
-        else:
-            return self.root.namelist()
+        return self._namelist
 
     def read_file(self, filename: str) -> str:
         """Retrieve an archive file's text content.
@@ -176,36 +200,85 @@ class ArchiveWrapper:
             ZIP_DEFLATED, ZIP_BZIP2 or ZIP_LZMA.
         RuntimeError
             If the archive was closed.
-        UnicodeDecodeError
-            If all attemps to read the file with different encodings failed.
         ValueError
             If the file is a directory.
         py7zr.exceptions.CrcError
             Decompression error.
 
         """
-        file_bytes: bytes = bytes()
-        text: str = ""
+        return self.read_files([filename])[filename]
+
+    def read_files(self, filenames: list[str]) -> dict[str, str]:
+        """Retrieve several archive files' text content.
+
+        7z files are extracted in a single call, which avoids browsing the
+        archive again, and then resetting it, for every file.
+
+        Parameters
+        ----------
+        filenames : list of str
+            The file names to read.
+
+        Returns
+        -------
+        dict of str to str
+            The files' text content by file name.
+
+        Raises
+        ------
+        KeyError
+            If a file doesn't exist in the archive.
+        NotImplementedError
+            If a file uses a compression method other than ZIP_STORED,
+            ZIP_DEFLATED, ZIP_BZIP2 or ZIP_LZMA.
+        RuntimeError
+            If the archive was closed.
+        ValueError
+            If a file is a directory.
+        py7zr.exceptions.CrcError
+            Decompression error.
+
+        """
+        files_bytes: dict[str, bytes] = {}
+        texts: dict[str, str] = {}
 
         try:
             if isinstance(self.root, SevenZipFile):
                 # SevenZipFile.read() takes a list of string and return a dict.
-                texts: dict[str, BytesIO] = self.root.read([filename])
-                self.root.reset()  # To avoid py7zr.exceptions.CrcError.
+                try:
+                    buffers: dict[str, BytesIO] = self.root.read(filenames)
 
-                with texts[filename] as buffer:
-                    file_bytes = buffer.getvalue()
+                finally:
+                    self.root.reset()  # To avoid py7zr.exceptions.CrcError.
+
+                for filename in filenames:
+                    with buffers[filename] as buffer:
+                        files_bytes[filename] = buffer.getvalue()
 
             else:
-                file_bytes = self.root.read(filename)
+                for filename in filenames:
+                    files_bytes[filename] = self.root.read(filename)
+
+            for filename, file_bytes in files_bytes.items():
+                if file_bytes[:2] in UTF16_BOMS:
+                    text: str = file_bytes.decode(
+                        encoding="utf-16", errors="ignore"
+                    )
+
+                    if "\x00" in text:
+                        text = text.replace("\x00", "\\00")
+
+                else:
+                    # NUL bytes are rare, escape them before decoding only if
+                    # there are any.
+                    if b"\x00" in file_bytes:
+                        file_bytes = file_bytes.replace(b"\x00", b"\\00")
 
-            try:
-                text = file_bytes.decode(encoding="utf-8")
+                    text = file_bytes.decode(encoding="utf-8", errors="ignore")
 
-            except UnicodeDecodeError:
-                text = file_bytes.decode(encoding="utf-8", errors="ignore")
+                texts[filename] = text
 
-            return text.replace("\x00", "\\00")
+            return texts
 
         except KeyError as err:
             raise KeyError("Not found.") from err
@@ -1,12 +1,11 @@
 """Data model to define user credentials found in leaks."""
 import re
 from dataclasses import dataclass
-from urllib.parse import ParseResult, ParseResultBytes, urlparse
 
 from .types import StealerNameType
 
 
-@dataclass
+@dataclass(slots=True)
 class Credential:
     """Class defining a credential.
 
@@ -44,8 +43,21 @@ class Credential:
     stealer_name: StealerNameType | None = None
 
 
-NORM_TEXT_PATTERN: re.Pattern[str] = re.compile(r"[\[\]\"']")
+# Brackets and quotes are removed, underscores are replaced by spaces.
+NORM_TEXT_TABLE: dict[int, str | None] = str.maketrans(
+    {"[": None, "]": None, '"': None, "'": None, "_": " "}
+)
 EMAIL_PATTERN: re.Pattern[str] = re.compile(r"\b(\S+)@(\S+\.\S+)\b")
+URL_NETLOC_REGEX: str = r"[\x00-\x20]*(?:[a-zA-Z][a-zA-Z0-9+.-]*:)?//([^/?#]*)"
+# Let's break down this regex (same rules as urllib.parse.urlsplit()):
+#
+# [\x00-\x20]*
+#         Leading control characters and spaces are ignored.
+# (?:[a-zA-Z][a-zA-Z0-9+.-]*:)?
+#         Optional scheme.
+# //([^/?#]*)
+#         Group 1: The network location, up to the path, query or fragment.
+URL_NETLOC_PATTERN: re.Pattern[str] = re.compile(URL_NETLOC_REGEX)
 
 
 def normalize_credential_text(credential: Credential) -> None:
@@ -58,8 +70,60 @@ def normalize_credential_text(credential: Credential) -> None:
 
     """
     if credential.software:
-        software: str = NORM_TEXT_PATTERN.sub("", credential.software.lower())
-        credential.software = software.replace("_", " ")
+        credential.software = credential.software.lower().translate(
+            NORM_TEXT_TABLE
+        )
+
+
+def get_url_hostname(url: str) -> str | None:
+    """Retrieve the lowercase host name of a URL.
+
+    Same as `urllib.parse.urlparse(url).hostname` without building the whole
+    parsing result. Unlike urlparse(), no ValueError is raised on mismatched
+    IPv6 brackets.
+
+    Parameters
+    ----------
+    url : str
+        The URL to parse.
+
+    Returns
+    -------
+    str or None
+        The host name if found. Otherwise, None.
+
+    """
+    matched: re.Match[str] | None = URL_NETLOC_PATTERN.match(url)
+
+    if not matched:
+        return None
+
+    # Remove user information, then the port.
+    hostinfo: str = matched.group(1).rpartition("@")[2]
+    _, bracket, bracketed = hostinfo.partition("[")
+    hostname: str = (
+        bracketed.partition("]")[0] if bracket else hostinfo.partition(":")[0]
+    )
+
+    if not hostname:
+        return None
+
+    # The IPv6 zone ID is case sensitive.
+    hostname, percent, zone = hostname.partition("%")
+
+    return hostname.lower() + percent + zone
+
+
+def is_word_character(char: str) -> bool:
+    r"""Return True if the character matches the regex `\w` (Unicode).
+
+    Parameters
+    ----------
+    char : str
+        The character to test. An empty string is not a word character.
+
+    """
+    return char.isalnum() or char == "_"
 
 
 def split_credential_email(credential: Credential) -> None:
@@ -71,7 +135,24 @@ def split_credential_email(credential: Credential) -> None:
         The credential object to update.
 
     """
-    if not credential.username:
+    if not credential.username or "@" not in credential.username:
+        return
+
+    local_part, _, email_domain = credential.username.partition("@")
+
+    # Fast path giving the same result as EMAIL_PATTERN for the common case:
+    # one @, no whitespace (isprintable() is False for whitespace other than
+    # space), word characters at both ends and a dot inside the domain.
+    if (
+        is_word_character(local_part[:1])
+        and is_word_character(email_domain[-1:])
+        and "." in email_domain[1:-1]
+        and "@" not in email_domain
+        and " " not in credential.username
+        and credential.username.isprintable()
+    ):
+        credential.local_part = local_part
+        credential.email_domain = email_domain
         return
 
     email_address: re.Match[str] | None = EMAIL_PATTERN.match(
@@ -95,8 +176,7 @@ def extract_credential_domain_name(credential: Credential) -> None:
     if not credential.host:
         return
 
-    url: ParseResult | ParseResultBytes = urlparse(credential.host)
+    hostname: str | None = get_url_hostname(credential.host)
 
-    if isinstance(url, ParseResult):
-        if url.hostname:
-            credential.domain = url.hostname
+    if hostname:
+        credential.domain = hostname
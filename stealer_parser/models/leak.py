@@ -6,12 +6,17 @@
 """
 from dataclasses import dataclass, field
 
-from .credential import Credential
+from .credential import (
+    Credential,
+    extract_credential_domain_name,
+    normalize_credential_text,
+    split_credential_email,
+)
 from .system import System
 from .types import StealerNameType
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemData:
     """Class defining a system's leaked data.
 
@@ -26,6 +31,8 @@ class SystemData:
     -------
     add_stealer_name(stealer_name)
         Add stealer name to every credentials.
+    finalize(stealer_name)
+        Post-process every credentials.
 
     """
 
@@ -47,8 +54,27 @@ class SystemData:
         for credential in self.credentials:
             credential.stealer_name = stealer_name
 
+    def finalize(self, stealer_name: StealerNameType | None) -> None:
+        """Post-process every credentials in a single pass.
 
-@dataclass
+        Normalize the software name, split the email address, extract the
+        domain name and add the stealer name. Intended to be called once the
+        whole system folder has been processed.
+
+        Parameters
+        ----------
+        stealer_name : stealer_parser.models.types.StealerType, optional
+            The stealer name.
+
+        """
+        for credential in self.credentials:
+            normalize_credential_text(credential)
+            split_credential_email(credential)
+            extract_credential_domain_name(credential)
+            credential.stealer_name = stealer_name
+
+
+@dataclass(slots=True)
 class Leak:
     """Class defining a leak (metadata and content).
 
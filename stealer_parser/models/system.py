@@ -1,8 +1,10 @@
 """Data model to define compromised systems found in leaks."""
 from dataclasses import dataclass
+from operator import attrgetter
+from typing import Callable
 
 
-@dataclass
+@dataclass(slots=True)
 class System:
     """Class defining a compromised system information.
 
@@ -23,6 +25,11 @@ class System:
     log_date : str, optional
         The compromission date.
 
+    Methods
+    -------
+    is_empty()
+        Return True if no attribute is set.
+
     """
 
     machine_id: str | None = None
@@ -32,3 +39,13 @@ class System:
     ip_address: str | None = None
     country: str | None = None
     log_date: str | None = None
+
+    def is_empty(self) -> bool:
+        """Return True if no attribute is set."""
+        return not any(_get_attributes(self))
+
+
+# Get every System attribute at once.
+_get_attributes: Callable[[System], tuple[str | None, ...]] = attrgetter(
+    *System.__slots__
+)
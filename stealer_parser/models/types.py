@@ -1,6 +1,6 @@
 """Type hints to support development process."""
 from datetime import datetime
-from typing import Literal, TypeAlias
+from typing import Literal, TypeAlias, TypeGuard, get_args
 
 __all__ = [
     "JSONValueType",
@@ -8,6 +8,8 @@ __all__ = [
     "JSONObjectType",
     "JSONType",
     "StealerNameType",
+    "STEALER_NAMES",
+    "is_stealer_name",
 ]
 
 JSONValueType: TypeAlias = (
@@ -29,3 +31,18 @@ JSONType: TypeAlias = JSONObjectType | JSONArrayType
 StealerNameType: TypeAlias = Literal[
     "redline", "stealc", "lummac2", "meta", "raccoon", "dcrat"
 ]
+
+# The handled infostealers names, for constant-time membership tests.
+STEALER_NAMES: frozenset[str] = frozenset(get_args(StealerNameType))
+
+
+def is_stealer_name(name: str) -> TypeGuard[StealerNameType]:
+    """Return True if the name is a handled infostealer name.
+
+    Parameters
+    ----------
+    name : str
+        The lowercase name to look up.
+
+    """
+    return name in STEALER_NAMES
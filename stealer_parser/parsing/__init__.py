@@ -2,6 +2,7 @@
 
 The lexer requires PLY (Python Lex-Yacc).
 """
+from .lexer import Token
 from .lexer_passwords import PasswordToken, tokenize_passwords
 from .lexer_system import SystemToken, tokenize_system
 from .parser import LogsParser
@@ -0,0 +1,190 @@
+"""Regex-based lexer shared by the passwords and system files lexers.
+
+The tokens are defined PLY-style in the lexer modules (`tokens`, `t_ignore`
+and `t_*` rules). Instead of letting PLY call Python code for every token, the
+rules are fused into a single regular expression in the order PLY tries them,
+and the text is scanned in one `re.finditer()` pass.
+
+Set the `STEALER_PARSER_USE_PLY` environment variable to `1` to lex with PLY
+instead.
+"""
+import os
+from operator import itemgetter
+from re import ASCII, IGNORECASE, VERBOSE, Pattern, RegexFlag, compile, escape
+from typing import Any, NamedTuple
+
+from stealer_parser.ply.src.ply.lex import LexError
+
+# The lexers regular expressions flags.
+LEXER_FLAGS: RegexFlag = ASCII | IGNORECASE | VERBOSE
+
+# Lex with PLY instead of the fused regex.
+USE_PLY: bool = os.environ.get("STEALER_PARSER_USE_PLY") == "1"
+
+
+class Token(NamedTuple):
+    """Class defining a token, a lightweight ply.lex.LexToken.
+
+    Attributes
+    ----------
+    type : str
+        The token type.
+    value : str
+        The matched text.
+    lexpos : int
+        Index of the token in the input text.
+
+    """
+
+    type: str
+    value: str
+    lexpos: int
+
+
+def compile_rules(
+    rules: dict[str, Any], prefix_first_chars: str | None = None
+) -> Pattern[str]:
+    """Fuse a lexer module's token rules into a single regular expression.
+
+    Like PLY, rules defined by functions are tried first in their definition
+    order, then rules defined by strings by decreasing regular expression
+    length.
+
+    Given the characters the prefix tokens can start with, the leading
+    `*PREFIX` rules are guarded by a lookahead so that they are skipped at
+    once, instead of one by one, on text that can't match any of them.
+
+    Parameters
+    ----------
+    rules : dict
+        The lexer module's namespace, containing `tokens` and the `t_*`
+        rules.
+    prefix_first_chars : str, optional
+        The first characters of the prefix tokens.
+
+    Returns
+    -------
+    re.Pattern
+        Alternation of the rules, each one in a group named after the token
+        type.
+
+    """
+    functions: list[tuple[int, str, str]] = []
+    strings: list[tuple[str, str]] = []
+
+    for token_type in rules["tokens"]:
+        rule: Any = rules[f"t_{token_type}"]
+
+        if callable(rule):
+            functions.append(
+                (rule.__code__.co_firstlineno, token_type, rule.__doc__)
+            )
+        else:
+            strings.append((token_type, rule))
+
+    ordered_rules: list[tuple[str, str]] = [
+        (token_type, regex) for _, token_type, regex in sorted(functions)
+    ] + sorted(strings, key=lambda string: len(string[1]), reverse=True)
+
+    alternatives: list[str] = [
+        f"(?P<{token_type}>{regex})" for token_type, regex in ordered_rules
+    ]
+
+    if prefix_first_chars:
+        count: int = 0
+
+        for token_type, _ in ordered_rules:
+            if not token_type.endswith("PREFIX"):
+                break
+            count += 1
+
+        alternatives[:count] = [
+            f"(?=[{escape(prefix_first_chars)}])"
+            f"(?:{'|'.join(alternatives[:count])})"
+        ]
+
+    return compile("|".join(alternatives), LEXER_FLAGS)
+
+
+def raise_illegal_character(
+    pattern: Pattern[str], text: str, ignore: str
+) -> None:
+    """Raise an error on the first character not matched by any rule.
+
+    Parameters
+    ----------
+    pattern : re.Pattern
+        The fused token rules.
+    text : str
+        The text to scan.
+    ignore : str
+        The ignored characters.
+
+    Raises
+    ------
+    ply.lex.LexError
+        If an illegal character was found.
+
+    """
+    gaps: list[tuple[int, int]] = []
+    position: int = 0
+
+    for matched in pattern.finditer(text):
+        gaps.append((position, matched.start()))
+        position = matched.end()
+
+    gaps.append((position, len(text)))
+
+    for start, end in gaps:
+        for index in range(start, end):
+            if text[index] not in ignore:
+                raise LexError(
+                    f"Scanning error. Illegal character '{text[index]}' at "
+                    f"index {index}",
+                    text[index:],
+                )
+
+
+def tokenize(pattern: Pattern[str], text: str, ignore: str) -> list[Token]:
+    """Split text into tokens.
+
+    The rules must not match the ignored characters.
+
+    Parameters
+    ----------
+    pattern : re.Pattern
+        The fused token rules (see compile_rules()).
+    text : str
+        The text to tokenize.
+    ignore : str
+        The characters to skip between tokens.
+
+    Returns
+    -------
+    list of Token
+        The produced tokens.
+
+    Raises
+    ------
+    ply.lex.LexError
+        If an illegal character was found.
+
+    """
+    tokens: list[Token] = [
+        Token(
+            matched.lastgroup,  # type: ignore[arg-type]
+            matched.group(),
+            matched.start(),
+        )
+        for matched in pattern.finditer(text)
+    ]
+
+    # Since tokens don't contain ignored characters, every other character
+    # was matched if the lengths add up. This is way faster than checking the
+    # gaps between tokens.
+    covered: int = sum(map(len, map(itemgetter(1), tokens)))
+
+    if covered + sum(map(text.count, ignore)) != len(text):
+        raise_illegal_character(pattern, text, ignore)
+
+    return tokens
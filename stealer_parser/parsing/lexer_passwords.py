@@ -28,8 +28,8 @@
 /*      'Seller:' | 'Log Tools:' | 'Free Logs:' */
 ```
 """
-import re
 from pathlib import Path
+from re import Pattern
 from typing import Literal, TypeAlias, get_args
 
 from verboselogs import VerboseLogger
@@ -37,6 +37,8 @@ from verboselogs import VerboseLogger
 from stealer_parser.helpers import dump_to_file
 from stealer_parser.ply.src.ply.lex import Lexer, LexError, LexToken, lex
 
+from .lexer import LEXER_FLAGS, USE_PLY, Token, compile_rules, tokenize
+
 # The ignored characters.
 t_ignore: str = "\t\r"
 
@@ -128,9 +130,20 @@ def t_error(token: LexToken) -> None:
     )
 
 
+# The first characters of the prefix tokens (case insensitive).
+PREFIX_FIRST_CHARS: str = "abfhlpsu["
+
+# The token rules fused into a single regex.
+PASSWORDS_PATTERN: Pattern[str] = compile_rules(globals(), PREFIX_FIRST_CHARS)
+
+# The tokens definitions and the lexer instantiation must be in the same file.
+# Building the lexer is costly, so it is built once and cloned for each file.
+PASSWORDS_LEXER: Lexer | None = lex(reflags=LEXER_FLAGS) if USE_PLY else None
+
+
 def tokenize_passwords(
     logger: VerboseLogger, filename: str, text: str
-) -> list[LexToken]:
+) -> list[Token]:
     """Tokenize a passwords file.
 
     Parameters
@@ -144,27 +157,26 @@ def tokenize_passwords(
 
     Returns
     -------
-    list of ply.lex.LexToken
+    list of stealer_parser.parsing.lexer.Token
         The produced tokens.
 
     Raises
     ------
     ply.lex.LexError
         If an illegal character was found.
-    SyntaxError
-        If can't build lexer.
 
     """
-    # The tokens definitions and the lexer instantiation must be in the same
-    # file.
-    lexer: Lexer = lex(reflags=re.ASCII | re.IGNORECASE | re.VERBOSE)
-
     try:
-        lexer.input(text)
+        if USE_PLY:
+            # Clones share the master regex but not the input.
+            lexer: Lexer = PASSWORDS_LEXER.clone()  # type: ignore[union-attr]
+            lexer.input(text)
+
+            return [Token(tok.type, tok.value, tok.lexpos) for tok in lexer]
 
-        return list(lexer)
+        return tokenize(PASSWORDS_PATTERN, text, t_ignore)
 
-    except (LexError, SyntaxError) as err:
+    except LexError as err:
         filepath = Path(filename)
         logs_dir: str = f"logs/lexing/{filepath.parent}"
 
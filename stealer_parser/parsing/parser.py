@@ -4,13 +4,18 @@ from base64 import b64decode
 from typing import TypeAlias
 
 from stealer_parser.models import Credential
-from stealer_parser.ply.src.ply.lex import LexToken
 
+from .lexer import Token
 from .lexer_passwords import PasswordToken
 from .lexer_system import SystemToken
 
 TokenType: TypeAlias = PasswordToken | SystemToken
 
+# The token types an entry is made of.
+ENTRY_TOKEN_TYPES: frozenset[TokenType] = frozenset(("WORD", "SPACE"))
+# The token types separating lines.
+BLANK_TOKEN_TYPES: frozenset[TokenType] = frozenset(("NEWLINE", "SPACE"))
+
 
 class LogsParser:
     """Class defining a stealer logs parser.
@@ -23,8 +28,10 @@ class LogsParser:
         Index of the current token.
     _size : int, default=0
         Tokens count.
-    _tokens : list of ply.lex.LexToken, default=[]
+    _tokens : list of stealer_parser.parsing.lexer.Token, default=[]
         The sequence of tokens produced by the lexer to iterate over.
+    _types : list of str, default=[]
+        The tokens types, to skip runs of tokens without unpacking them.
     _output : list of stealer_parser.models.Credential, default=[]
         Parsed logs data stored in a list of JSON-formatted objects.
 
@@ -32,16 +39,23 @@ class LogsParser:
     -------
     get_current_token()
         Get currently analyzed token.
+    peek(expected_type, expected_value=None)
+        Get token if it matches expected type and, if provided, value.
+    commit()
+        Consume current token.
     eat(expected_type, expected_value=None)
         Consume token if it matches expected type and, if provided, value.
+    skip(types)
+        Consume tokens as long as their type is one of the given types.
 
     """
 
-    def __init__(self, tokens: list[LexToken]) -> None:
+    def __init__(self, tokens: list[Token]) -> None:
         """Instantiate parser."""
         self._pos: int = 0
         self._size: int = len(tokens)
-        self._tokens: list[LexToken] = tokens
+        self._tokens: list[Token] = tokens
+        self._types: list[str] = [token.type for token in tokens]
         self._output: list[Credential] = []
 
     # Properties ##############################################################
@@ -74,7 +88,7 @@ class LogsParser:
 
     # Methods #################################################################
 
-    def get_current_token(self) -> LexToken:
+    def get_current_token(self) -> Token:
         """Get currently analyzed token.
 
         Raises
@@ -84,14 +98,49 @@ class LogsParser:
 
         Returns
         -------
-        ply.lex.LexToken
+        stealer_parser.parsing.lexer.Token
 
         """
         return self._tokens[self._pos]
 
+    def peek(
+        self, expected_type: TokenType, expected_value: str | None = None
+    ) -> Token | None:
+        """Get token if it matches expected type and, if provided, value.
+
+        The token is not consumed, see commit().
+
+        Parameters
+        ----------
+        expected_type : stealurk.parsing.parser.TokenType
+            The expected token type.
+        expected_value : str, optional
+            The expected token value.
+
+        Returns
+        -------
+        stealer_parser.parsing.lexer.Token or None
+            The current token. Otherwise, None.
+
+        """
+        position: int = self._pos
+
+        # Check the type first since it mostly doesn't match.
+        if position < self._size and self._types[position] == expected_type:
+            token: Token = self._tokens[position]
+
+            if expected_value is None or token.value == expected_value:
+                return token
+
+        return None
+
+    def commit(self) -> None:
+        """Consume current token."""
+        self._pos += 1
+
     def eat(
         self, expected_type: TokenType, expected_value: str | None = None
-    ) -> LexToken | None:
+    ) -> Token | None:
         """Consume token if it matches expected type and, if provided, value.
 
         Parameters
@@ -103,22 +152,48 @@ class LogsParser:
 
         Returns
         -------
-        ply.lex.LexToken or None
+        stealer_parser.parsing.lexer.Token or None
             The consumed token. Otherwise, None.
 
         """
-        eaten_token: LexToken | None = None
+        eaten_token: Token | None = None
+        position: int = self._pos
 
-        if self._pos < self._size:
-            token: LexToken = self.get_current_token()
+        # Check the type first since it mostly doesn't match.
+        if position < self._size and self._types[position] == expected_type:
+            token: Token = self._tokens[position]
 
-            if token.type == expected_type:
-                if expected_value is None or token.value == expected_value:
-                    eaten_token = token
-                    self._pos += 1
+            if expected_value is None or token.value == expected_value:
+                eaten_token = token
+                self._pos = position + 1
 
         return eaten_token
 
+    def skip(self, types: frozenset[TokenType]) -> int:
+        """Consume tokens as long as their type is one of the given types.
+
+        Parameters
+        ----------
+        types : frozenset of stealer_parser.parsing.parser.TokenType
+            The token types to skip.
+
+        Returns
+        -------
+        int
+            The number of consumed tokens.
+
+        """
+        start: int = self._pos
+        position: int = start
+        token_types: list[str] = self._types
+
+        while position < self._size and token_types[position] in types:
+            position += 1
+
+        self._pos = position
+
+        return position - start
+
 
 def parse_entry(parser: LogsParser) -> str | None:
     """Concatenate words and spaces until newline.
@@ -126,19 +201,19 @@ def parse_entry(parser: LogsParser) -> str | None:
     entry : WORD
           | entry SPACE WORD
     """
-    entry: str = ""
+    parts: list[str] = []
 
     while parser.position < parser.size:
-        token: LexToken | None = parser.get_current_token()
+        token: Token | None = parser.get_current_token()
         parser.position += 1
 
-        if not token or token.type not in ("WORD", "SPACE"):
+        if not token or token.type not in ENTRY_TOKEN_TYPES:
             break
 
-        entry += token.value
+        parts.append(token.value)
 
     # NOTE: A valid entry can be empty or only spaces.
-    return entry if entry else None
+    return "".join(parts) or None
 
 
 def parse_multiline_entry(parser: LogsParser) -> str | None:
@@ -148,23 +223,27 @@ def parse_multiline_entry(parser: LogsParser) -> str | None:
                     | multiline_entry NEWLINE WORD
 
     """
-    entry: str = ""
+    words: list[str] = []
 
     while parser.position < parser.size:
-        token: LexToken | None = parser.eat("WORD") or parser.eat("NEWLINE")
+        token: Token | None = parser.eat("WORD") or parser.eat("NEWLINE")
 
         if not token:
             break
 
         if token.type == "WORD":
-            entry += token.value
+            words.append(token.value)
+
+    entry: str = "".join(words)
 
     if entry:
-        try:
-            return b64decode(entry).decode("utf-8").replace("\n", "")
+        # b64decode() raises on non-ASCII strings, don't even try these.
+        if entry.isascii():
+            try:
+                return b64decode(entry).decode("utf-8").replace("\n", "")
 
-        except (binascii.Error, ValueError):
-            pass
+            except (binascii.Error, ValueError):
+                pass
 
         return entry
 
@@ -180,14 +259,9 @@ def skip_header_line(parser: LogsParser) -> bool:
                 | WORD header_line
 
     """
-    is_header: bool = bool(parser.eat("WORD") or parser.eat("SPACE"))
-
-    if not is_header:
+    if not parser.skip(ENTRY_TOKEN_TYPES):
         return False
 
-    while is_header:
-        is_header = bool(parser.eat("WORD") or parser.eat("SPACE"))
-
     return bool(parser.eat("NEWLINE"))
 
 
@@ -67,22 +67,19 @@ follows:
 """
 from json import dumps
 from pathlib import Path
-from re import Match, Pattern, compile, search
+from re import Match, Pattern, compile
 from typing import Callable, TypeAlias
 
 from verboselogs import VerboseLogger
 
 from stealer_parser.helpers import dump_to_file
-from stealer_parser.models import (
-    Credential,
-    extract_credential_domain_name,
-    normalize_credential_text,
-    split_credential_email,
-)
-from stealer_parser.ply.src.ply.lex import LexToken
+from stealer_parser.models import Credential
 
+from .lexer import Token
 from .lexer_passwords import tokenize_passwords
 from .parser import (
+    BLANK_TOKEN_TYPES,
+    ENTRY_TOKEN_TYPES,
     LogsParser,
     parse_entry,
     parse_multiline_entry,
@@ -104,6 +101,7 @@ PASSWORDS_BROWSER_REGEX: str = r"(?i)\bPasswords\[([A-Za-z0-9_ ]+)\]\S+\.txt\b"
 #              Group 1: The browser name
 # \S+\.txt   Characters followed by .txt
 # \b         Word boundary.
+PASSWORDS_BROWSER_PATTERN: Pattern[str] = compile(PASSWORDS_BROWSER_REGEX)
 
 SPECIAL_SOFT_PATTERN: Pattern[str] = compile(r'\["(\S+)" = "(\S+)"\]')
 FILEGRABBER_PATTERN: Pattern[str] = compile(
@@ -125,7 +123,7 @@ def get_browser_name(filename: str) -> str | None:
         The browser filename if found. Otherwise, None.
 
     """
-    matched: Match[str] | None = search(PASSWORDS_BROWSER_REGEX, filename)
+    matched: Match[str] | None = PASSWORDS_BROWSER_PATTERN.search(filename)
 
     return matched.group(1) if matched else None
 
@@ -137,8 +135,7 @@ def skip_profile_line(parser: LogsParser) -> None:
 
     """
     if parser.eat("WORD", "profile:"):
-        while parser.eat("WORD") or parser.eat("SPACE"):
-            pass
+        parser.skip(ENTRY_TOKEN_TYPES)
 
 
 def parse_software_line(parser: LogsParser, credential: Credential) -> bool:
@@ -159,18 +156,17 @@ def parse_software_line(parser: LogsParser, credential: Credential) -> bool:
         skip_profile_line(parser)
         return True
 
-    software: LexToken | None = parser.eat("SOFT_NO_PREFIX")
+    software: Token | None = parser.peek("SOFT_NO_PREFIX")
 
     if software:
         matched: Match[str] | None = SPECIAL_SOFT_PATTERN.match(software.value)
 
         if matched:
+            parser.commit()
             credential.software = f"{matched.group(1)} {matched.group(2)}"
             parser.eat("NEWLINE")
             return True
 
-        parser.position -= 1
-
     return False
 
 
@@ -185,7 +181,6 @@ def parse_host_line(parser: LogsParser, credential: Credential) -> bool:
     if parser.eat("HOST_PREFIX"):
         if parser.eat("SPACE"):
             credential.host = parse_entry(parser)
-            extract_credential_domain_name(credential)
 
         parser.eat("NEWLINE")
         return True
@@ -204,7 +199,6 @@ def parse_user_line(parser: LogsParser, credential: Credential) -> bool:
     if parser.eat("USER_PREFIX"):
         if parser.eat("SPACE"):
             credential.username = parse_entry(parser)
-            split_credential_email(credential)
 
         parser.eat("NEWLINE")
         return True
@@ -245,12 +239,25 @@ def parse_password_line(parser: LogsParser, credential: Credential) -> bool:
     return False
 
 
+# The user block lines parsing functions, tried in this order.
+USER_BLOCK_FUNCS: tuple[ParsingFunc, ...] = (
+    parse_software_line,
+    parse_host_line,
+    parse_user_line,
+    parse_password_line,
+)
+# Bitmask of the user block lines to parse, one bit per USER_BLOCK_FUNCS
+# index.
+ALL_USER_BLOCK_LINES: int = (1 << len(USER_BLOCK_FUNCS)) - 1
+SOFTWARE_LINE: int = 1 << USER_BLOCK_FUNCS.index(parse_software_line)
+
+
 def parse_line(
-    parsing_funcs: list[ParsingFunc],
+    remaining: int,
     parser: LogsParser,
     credential: Credential,
-) -> bool:
-    """Call the list functions in turn until one of them evaluates to True.
+) -> int:
+    """Call the remaining functions in turn until one of them returns True.
 
     Sometimes, the logs data order can vary. This helper aims to handle any
     possible configuration.
@@ -263,8 +270,8 @@ def parse_line(
 
     Parameters
     ----------
-    parsing_funcs : list of ParsingFunc
-        The functions to test.
+    remaining : int
+        Bitmask of the USER_BLOCK_FUNCS functions to test.
     parser : stealurk.parsing.parser.LogsParser
         The parser object.
     credential : stealurk.models.credential.Credential
@@ -272,17 +279,22 @@ def parse_line(
 
     Returns
     -------
-    bool
+    int
+        The remaining functions bitmask, without the one that parsed a line
+        if any.
 
     """
-    for func in parsing_funcs:
-        if func(parser, credential):  # Line was successfully parsed.
-            parsing_funcs.remove(func)
-            while parser.eat("NEWLINE") or parser.eat("SPACE"):
-                pass
-            return True
+    bit: int = 1
 
-    return False
+    for func in USER_BLOCK_FUNCS:
+        if remaining & bit and func(parser, credential):
+            # Line was successfully parsed.
+            parser.skip(BLANK_TOKEN_TYPES)
+            return remaining & ~bit
+
+        bit <<= 1
+
+    return remaining
 
 
 def parse_user_block(parser: LogsParser, filename: str) -> bool:
@@ -294,36 +306,37 @@ def parse_user_block(parser: LogsParser, filename: str) -> bool:
 
     """
     credential = Credential()
-    parsing_funcs: list[ParsingFunc] = [
-        parse_software_line,
-        parse_host_line,
-        parse_user_line,
-        parse_password_line,
-    ]
+    remaining: int = ALL_USER_BLOCK_LINES
 
     # This is a work around to handle any possible lines order of appearance.
     while True:
-        if not parse_line(parsing_funcs, parser, credential):
+        parsed: int = parse_line(remaining, parser, credential)
+
+        if parsed == remaining:
             break
+        remaining = parsed
 
     # Append block data to output if it contains at least one attribute.
     # Indeed, case can happen where a user block was empty but grammaticaly
     # correct.
     # For example: "Soft: \nHost: \nUser: \nPassword:\n"
-    if any(list(credential.__dict__.values())):
+    # Only the fields below can be set by the line parsers.
+    if (
+        credential.software
+        or credential.host
+        or credential.username
+        or credential.password
+    ):
         # If the software/browser was not found in file text, search filename.
-        if parse_software_line in parsing_funcs:
+        if remaining & SOFTWARE_LINE:
             credential.software = get_browser_name(filename)
-            if credential.software:
-                parsing_funcs.remove(parse_software_line)
 
         credential.filepath = filename
-        normalize_credential_text(credential)
         parser.output.append(credential)
         return True
 
     # Must have parsed at least 3 lines.
-    return len(parsing_funcs) < 2
+    return remaining.bit_count() < 2
 
 
 def parse_passwords(
@@ -357,7 +370,7 @@ def parse_passwords(
         If the lexer found an unexpected symbol.
 
     """
-    tokens: list[LexToken] = tokenize_passwords(logger, filename, text)
+    tokens: list[Token] = tokenize_passwords(logger, filename, text)
     parser = LogsParser(tokens)
     parsed_seller: bool = False
 
@@ -381,7 +394,9 @@ def parse_passwords(
             f"Unexpected token '{parser.get_current_token()}' at position "
             f"{parser.position}/{parser.size}."
         )
-        doc: str = dumps(tokens, ensure_ascii=False, default=vars, indent=4)
+        doc: str = dumps(
+            [token._asdict() for token in tokens], ensure_ascii=False, indent=4
+        )
         filepath = Path(filename)
         logs_dir: str = f"logs/parsing/{filepath.parent}"
         dump_to_file(
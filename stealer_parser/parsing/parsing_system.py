@@ -77,18 +77,13 @@ the times named as follows:
 - `UserInformation.txt`
 """
 from re import Match, Pattern, compile
-from typing import Callable, TypeAlias
 
 from verboselogs import VerboseLogger
 
 from stealer_parser.models import System, SystemData
-from stealer_parser.ply.src.ply.lex import LexToken
 
-from .lexer_system import tokenize_system
-from .parser import LogsParser, parse_entry
-
-# Type alias for parsing function.
-ParsingFunc: TypeAlias = Callable[[LogsParser, System], bool]
+from .lexer import LEXER_FLAGS
+from .lexer_system import PREFIX_FIRST_CHARS, PREFIX_RULES, tokenize_system
 
 IP_REGEX: str = r"(?i)\b(ip(address)?)\b: ?(\S+)"
 # Let's break down this regex:
@@ -101,6 +96,53 @@ IP_REGEX: str = r"(?i)\b(ip(address)?)\b: ?(\S+)"
 #         Group 3: The IP address.
 IP_PATTERN: Pattern[str] = compile(IP_REGEX)
 
+# The System attributes filled by each prefix token, the other prefixes are
+# skipped.
+SYSTEM_FIELDS: dict[str, str] = {
+    "UID_PREFIX": "machine_id",
+    "COMPUTER_NAME_PREFIX": "computer_name",
+    "HWID_PREFIX": "hardware_id",
+    "USERNAME_PREFIX": "machine_user",
+    "IP_PREFIX": "ip_address",
+    "COUNTRY_PREFIX": "country",
+    "LOG_DATE_PREFIX": "log_date",
+}
+
+# The prefix token rules, each one in a group named after the token type.
+PREFIX_REGEX: str = (
+    f"(?=[{PREFIX_FIRST_CHARS}])(?:"
+    + "|".join(f"(?P<{name}>{regex})" for name, regex in PREFIX_RULES.items())
+    + ")"
+)
+# The prefix token rules, without groups names.
+ANY_PREFIX_REGEX: str = f"(?:{'|'.join(PREFIX_RULES.values())})"
+
+# Prefix at the current position.
+PREFIX_PATTERN: Pattern[str] = compile(PREFIX_REGEX, LEXER_FLAGS)
+# Prefix at the start of a later token, i.e. right after a whitespace.
+NEXT_PREFIX_PATTERN: Pattern[str] = compile(
+    rf"(?<!\S){PREFIX_REGEX}", LEXER_FLAGS
+)
+
+VALUE_REGEX: str = (
+    rf"[\t\r]*(?:(?P<SPACE>\ +)"
+    rf"(?P<entry>(?:(?!{ANY_PREFIX_REGEX})\S+|[\ \t\r]+)*)"
+    rf"(?:\n+|{ANY_PREFIX_REGEX})?)?(?:[\t\r]*\n+)?"
+)
+# Let's break down this regex, matched right after a prefix token:
+#
+# [\t\r]*      Ignored characters, they may appear between any tokens.
+# (?P<SPACE>\ +)
+#             The SPACE between the prefix and the entry. Without it, the
+#             value is not set.
+# (?P<entry>(?:(?!PREFIX)\S+|[\ \t\r]+)*)
+#             The entry: words and spaces, until a newline or a prefix.
+# (?:\n+|PREFIX)?
+#             The token ending the entry is consumed as well.
+# (?:[\t\r]*\n+)?
+#             Optional NEWLINE.
+VALUE_PATTERN: Pattern[str] = compile(VALUE_REGEX, LEXER_FLAGS)
+
 
 def retrieve_ip_only(text: str, system_data: SystemData) -> None:
     """Retrieve IP address from a file.
@@ -113,150 +155,16 @@ def retrieve_ip_only(text: str, system_data: SystemData) -> None:
         The compromised system information.
 
     """
+    # Most IP files only contain the address, without any "IP:" label.
+    if ":" not in text:
+        return
+
     matched: Match[str] | None = IP_PATTERN.search(text)
 
-    if matched and matched.group(3):
+    if matched and matched[3]:
         if not system_data.system:
             system_data.system = System()
-        system_data.system.ip_address = matched.group(3)
-
-
-def parse_uid_line(parser: LogsParser, system: System) -> bool:
-    """Parse machine ID (UID).
-
-    uid_line : UID_PREFIX NEWLINE
-             | UID_PREFIX SPACE NEWLINE
-             | UID_PREFIX SPACE entry NEWLINE
-             | list_element uid_line
-
-    """
-    if parser.eat("UID_PREFIX"):
-        if parser.eat("SPACE"):
-            system.machine_id = parse_entry(parser)
-
-        parser.eat("NEWLINE")
-        return True
-
-    return False
-
-
-def parse_computer_line(parser: LogsParser, system: System) -> bool:
-    """Parse computer name.
-
-    computer_line : COMPUTER_NAME_PREFIX NEWLINE
-                  | COMPUTER_NAME_PREFIX SPACE NEWLINE
-                  | COMPUTER_NAME_PREFIX SPACE entry NEWLINE
-                  | list_element computer_line
-
-    """
-    if parser.eat("COMPUTER_NAME_PREFIX"):
-        if parser.eat("SPACE"):
-            system.computer_name = parse_entry(parser)
-
-        parser.eat("NEWLINE")
-        return True
-
-    return False
-
-
-def parse_hwid_line(parser: LogsParser, system: System) -> bool:
-    """Parse hardware ID.
-
-    hwid_line : HWID_PREFIX NEWLINE
-              | HWID_PREFIX SPACE NEWLINE
-              | HWID_PREFIX SPACE entry NEWLINE
-              | list_element hwid_line
-
-    """
-    if parser.eat("HWID_PREFIX"):
-        if parser.eat("SPACE"):
-            system.hardware_id = parse_entry(parser)
-
-        parser.eat("NEWLINE")
-        return True
-
-    return False
-
-
-def parse_username_line(parser: LogsParser, system: System) -> bool:
-    """Parse computer's username.
-
-    user_line : USERNAME_PREFIX NEWLINE
-              | USERNAME_PREFIX SPACE NEWLINE
-              | USERNAME_PREFIX SPACE entry NEWLINE
-              | list_element user_line
-
-    """
-    if parser.eat("USERNAME_PREFIX"):
-        if parser.eat("SPACE"):
-            system.machine_user = parse_entry(parser)
-
-        parser.eat("NEWLINE")
-        return True
-
-    return False
-
-
-def parse_ip_line(parser: LogsParser, system: System) -> bool:
-    """Parse IP address.
-
-    ip_line : IP_PREFIX NEWLINE
-            | IP_PREFIX SPACE NEWLINE
-            | IP_PREFIX SPACE entry NEWLINE
-            | list_element ip_line
-
-    """
-    ip_token: LexToken | None = parser.eat("IP_PREFIX")
-
-    if ip_token:
-        if parser.eat("SPACE"):
-            if ip_token.value.lower() == "lanip" and system.ip_address:
-                parser.position += 1  # Prefer IP over LANIP.
-            else:
-                system.ip_address = parse_entry(parser)
-
-        parser.eat("NEWLINE")
-        return True
-
-    return False
-
-
-def parse_country_line(parser: LogsParser, system: System) -> bool:
-    """Parse machine's country.
-
-    country_line : COUNTRY_PREFIX NEWLINE
-                 | COUNTRY_PREFIX SPACE NEWLINE
-                 | COUNTRY_PREFIX SPACE entry NEWLINE
-                 | list_element country_line
-
-    """
-    if parser.eat("COUNTRY_PREFIX"):
-        if parser.eat("SPACE"):
-            system.country = parse_entry(parser)
-
-        parser.eat("NEWLINE")
-        return True
-
-    return False
-
-
-def parse_log_date_line(parser: LogsParser, system: System) -> bool:
-    """Parse compromission date.
-
-    log_date_line : LOG_DATE_PREFIX NEWLINE
-                  | LOG_DATE_PREFIX SPACE NEWLINE
-                  | LOG_DATE_PREFIX SPACE entry NEWLINE
-                  | list_element log_date_line
-
-    """
-    if parser.eat("LOG_DATE_PREFIX"):
-        if parser.eat("SPACE"):
-            system.log_date = parse_entry(parser)
-
-        parser.eat("NEWLINE")
-        return True
-
-    return False
+        system_data.system.ip_address = matched[3]
 
 
 def parse_system(
@@ -268,6 +176,10 @@ def parse_system(
            | information
            | header_line
 
+    Instead of tokenizing the whole file, the prefix tokens are searched for
+    at the tokens boundaries and only their values are matched. The other
+    tokens are skipped anyway.
+
     Parameters
     ----------
     logger : verboselogs.VerboseLogger
@@ -288,41 +200,49 @@ def parse_system(
         If the lexer found an unexpected symbol.
 
     """
-    tokens: list[LexToken] = tokenize_system(logger, filename, text)
-    parser: LogsParser = LogsParser(tokens)
+    # Form feeds and vertical tabs are the only characters the lexer rejects,
+    # let it report them.
+    if "\f" in text or "\v" in text:
+        tokenize_system(logger, filename, text)
+
     system = System()
+    position: int = 0
 
     # The parsing is way simpler than for passwords since each line appears
     # only once in the file.
     # On purpose, a lot of lines are skipped and no error is raised in case of
     # grammar error
-    while parser.position < parser.size:
-        token: LexToken = parser.get_current_token()
-
-        match token.type:
-            case "UID_PREFIX":
-                parse_uid_line(parser, system)
-
-            case "COMPUTER_NAME_PREFIX":
-                parse_computer_line(parser, system)
-
-            case "HWID_PREFIX":
-                parse_hwid_line(parser, system)
-
-            case "USERNAME_PREFIX":
-                parse_username_line(parser, system)
-
-            case "IP_PREFIX":
-                parse_ip_line(parser, system)
-
-            case "COUNTRY_PREFIX":
-                parse_country_line(parser, system)
-
-            case "LOG_DATE_PREFIX":
-                parse_log_date_line(parser, system)
-
-            case _:
-                parser.position += 1  # skip
+    while True:
+        # A prefix directly follows the previous one or a later token starts
+        # with one.
+        prefix: Match[str] | None = PREFIX_PATTERN.match(
+            text, position
+        ) or NEXT_PREFIX_PATTERN.search(text, position)
+
+        if not prefix:
+            break
+
+        position = prefix.end()
+        field: str | None = SYSTEM_FIELDS.get(prefix.lastgroup or "")
+
+        if not field:
+            continue  # skip
+
+        # The value pattern matches the empty string at worst.
+        value: Match[str] = VALUE_PATTERN.match(
+            text, position
+        )  # type: ignore[assignment]
+        position = value.end()
+
+        # Prefer IP over LANIP.
+        if value["SPACE"] and not (
+            system.ip_address and prefix.group().lower() == "lanip"
+        ):
+            # NOTE: A valid entry can be empty or only spaces.
+            entry: str = value["entry"].replace("\t", "").replace("\r", "")
+            setattr(system, field, entry or None)
 
     # Append block data to output if it contains at least one attribute.
-    return system if any(list(system.__dict__.values())) else None
+    if not system.is_empty():
+        return system
+    return None
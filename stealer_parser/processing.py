@@ -1,12 +1,20 @@
 """Infostealer logs parser."""
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from itertools import pairwise
+from operator import attrgetter
+from os import cpu_count
 from re import Match, Pattern, compile
+from typing import TypeAlias
 
 from py7zr.exceptions import CrcError
 from rarfile import BadRarFile
 from verboselogs import VerboseLogger
 
+from stealer_parser.helpers import init_logger
 from stealer_parser.models import (
     ArchiveWrapper,
     Leak,
@@ -23,10 +31,12 @@ from stealer_parser.ply.src.ply.lex import LexError
 from stealer_parser.search_stealer_credits import search_stealer_name
 
 # Files containing useful information such as credentials and credits.
-FILENAMES_REGEX: str = r"(?i).*((password(?!cracker))|(system|information|userinfo)|(\bip)|(credits|copyright|read)).*\.txt"  # noqa: E501
+FILENAMES_REGEX: str = r"(?i)(.*)(?:(password(?!cracker))|(system|information|userinfo)|(\bip)|(credits|copyright|read)).*\.txt"  # noqa: E501
 # Let's break down this regex:
 #
 # (?i)       Case insensitive
+# (.*)       Group 1: anything before the substring. It is closed before the
+#            substring's group, which is then the match's lastindex.
 # (password)|(\bcc(\b|.))|([^#](system|information|userinfo)) ...
 #            Match substring.
 #            Group 2: password not followed by cracker -> credentials
@@ -39,7 +49,7 @@ FILENAMES_PATTERN: Pattern[str] = compile(FILENAMES_REGEX)
 
 
 class LogFileType(Enum):
-    """Log files types."""
+    """Log files types, valued after their FILENAMES_PATTERN group."""
 
     PASSWORDS = 2
     SYSTEM = 3
@@ -47,7 +57,7 @@ class LogFileType(Enum):
     COPYRIGHT = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class LogFile:
     """Class defining a log file to be parsed.
 
@@ -68,6 +78,21 @@ class LogFile:
     system_dir: str
 
 
+# A system directory's files to parse, with their complete path and content.
+SystemDirContents: TypeAlias = list[tuple[LogFile, str, str]]
+
+# The number of system directories whose files are extracted at once. Every
+# read of a solid 7z archive decompresses it from the start.
+READ_BATCH_SIZE: int = 32
+
+# The number of system directories submitted to each worker process ahead of
+# the parsed ones, bounding the memory held by pending results.
+PENDING_PER_JOB: int = 2
+
+# The logger of a worker process, set by _init_worker().
+_worker_logger: VerboseLogger | None = None
+
+
 def get_system_dir(filepath: str) -> str:
     """Retrieve name of the compromised system directory.
 
@@ -111,23 +136,45 @@ def generate_file_list(root: ArchiveWrapper) -> list[LogFile]:
 
     """
     files: list[LogFile] = []
-
-    for name in sorted(root.namelist()):
-        matched: Match[str] | None = FILENAMES_PATTERN.search(name)
+    # The files of a directory are mostly listed in a row. Names sharing the
+    # path up to the second slash share the system directory as well.
+    dir_prefix: str | None = None
+    system_dir: str = ""
+
+    for name in root.namelist():
+        # Every match requires a ".txt" somewhere in the name, so the regex
+        # is skipped for screenshots, cookies databases, wallets, etc.
+        if ".txt" not in name.lower():
+            continue
+
+        # The leading ".*" lets any match start at the beginning of a single
+        # line name, so match() yields the same groups as search() without
+        # retrying every start position.
+        matched: Match[str] | None = (
+            FILENAMES_PATTERN.match(name)
+            if "\n" not in name
+            else FILENAMES_PATTERN.search(name)
+        )
 
         if matched:
-            log_type: LogFileType
+            # The matched substring's group is the last one.
+            log_type = LogFileType(matched.lastindex)
 
-            if matched.group(2):
-                log_type = LogFileType.PASSWORDS
-            elif matched.group(3) and "#" not in name:
-                log_type = LogFileType.SYSTEM
-            elif matched.group(4):
-                log_type = LogFileType.IP
-            elif matched.group(5):
-                log_type = LogFileType.COPYRIGHT
+            if log_type is LogFileType.SYSTEM and "#" in name:
+                continue
 
-            files.append(LogFile(log_type, name, get_system_dir(name)))
+            if dir_prefix is None or not name.startswith(dir_prefix):
+                system_dir = get_system_dir(name)
+                second_slash: int = name.find("/", name.find("/") + 1)
+                dir_prefix = (
+                    name[: second_slash + 1] if second_slash >= 0 else None
+                )
+
+            files.append(LogFile(log_type, name, system_dir))
+
+    # Sort the interesting files only, rather than every archive member, to
+    # group them by system directory.
+    files.sort(key=attrgetter("filename"))
 
     return files
 
@@ -177,29 +224,29 @@ def parse_file(
         logger.error(f"Failed parsing file '{filename}': {err}")
 
 
-def process_system_dir(
+def read_system_dir(
     logger: VerboseLogger,
-    leak: Leak,
     archive: ArchiveWrapper,
     files: list[LogFile],
-) -> int:
-    """Process a system directory's files.
+    texts: dict[str, str] | None = None,
+) -> SystemDirContents:
+    """Read a system directory's files.
 
     Parameters
     ----------
     logger : verboselogs.VerboseLogger
         The program's logger.
-    leak : stealer_parser.models.leak.Leak
-        The object to store the leak's metadata and content.
     archive : stealer_parser.models.archive_wrapper.ArchiveWrapper
         The archive wrapper.
     files : list of LogFile
-        The files to parse.
+        The system directory's files.
+    texts : dict of str to str, optional
+        The files' text content by file name, if already extracted.
 
     Returns
     -------
-    int
-        The number of parsed credentials.
+    SystemDirContents
+        The files that could be read, with their complete path and content.
 
     Raises
     ------
@@ -210,52 +257,225 @@ def process_system_dir(
     rarfile.BadRarFile
         If failed to read the archive's files.
 
+    """
+    contents: SystemDirContents = []
+    archive_prefix: str = f"{archive.filename}/"
+
+    if texts is None:
+        texts = {}
+
+        try:
+            # Extract the directory's files at once, then fall back to
+            # reading them one by one to report errors per file.
+            texts = archive.read_files([file.filename for file in files])
+
+        except (CrcError, KeyError, UnicodeDecodeError, ValueError):
+            pass
+
+    for file in files:
+        filename: str = archive_prefix + file.filename
+
+        try:
+            text: str = (
+                texts[file.filename]
+                if file.filename in texts
+                else archive.read_file(file.filename)
+            )
+
+        except (CrcError, KeyError, UnicodeDecodeError, ValueError) as err:
+            logger.error(f"Error reading file '{filename}': {err}")
+
+        else:
+            contents.append((file, filename, text))
+
+    return contents
+
+
+def parse_system_dir(
+    logger: VerboseLogger, contents: SystemDirContents
+) -> SystemData | None:
+    """Parse a system directory's files.
+
+    Parameters
+    ----------
+    logger : verboselogs.VerboseLogger
+        The program's logger.
+    contents : SystemDirContents
+        The files to parse, with their complete path and content.
+
+    Returns
+    -------
+    stealer_parser.models.leak.SystemData or None
+        The collected system's data, or None if nothing was found.
+
     """
     stealer_name: StealerNameType | None = None
     system_data = SystemData()
-    current_dir: str = files[0].system_dir
-    count: int = 0
 
-    for file in files:
-        filename: str = f"{archive.filename}/{file.filename}"
+    # Credits files are meant to name the stealer and are much smaller than
+    # passwords files, search them first.
+    for file, _, text in contents:
+        if file.type is LogFileType.COPYRIGHT:
+            stealer_name = search_stealer_name(text)
 
-        if file.system_dir != current_dir:
-            break
+            if stealer_name:
+                break
 
-        try:
-            text: str = archive.read_file(file.filename)
+    for file, filename, text in contents:
+        # Credits files were searched above and parse_file() ignores them.
+        if file.type is LogFileType.COPYRIGHT:
+            continue
 
+        try:
             if not stealer_name:
                 stealer_name = search_stealer_name(text)
 
             parse_file(logger, filename, system_data, file, text)
 
-        except (CrcError, KeyError, UnicodeDecodeError, ValueError) as err:
-            logger.error(f"Error reading file '{filename}': {err}")
-
         except TypeError as err:
             logger.error(f"Error '{filename}': {err}")
 
-        count += 1
-
-    if system_data.credentials and stealer_name:
-        system_data.add_stealer_name(stealer_name)
+    system_data.finalize(stealer_name)
 
     if (
         system_data.system
-        and any(list(system_data.system.__dict__.values()))
+        and not system_data.system.is_empty()
         or system_data.credentials
     ):
+        return system_data
+
+    return None
+
+
+def process_system_dir(
+    logger: VerboseLogger, leak: Leak, contents: SystemDirContents
+) -> None:
+    """Process a system directory's files.
+
+    Parameters
+    ----------
+    logger : verboselogs.VerboseLogger
+        The program's logger.
+    leak : stealer_parser.models.leak.Leak
+        The object to store the leak's metadata and content.
+    contents : SystemDirContents
+        The files to parse, with their complete path and content.
+
+    """
+    system_data: SystemData | None = parse_system_dir(logger, contents)
+
+    if system_data:
         leak.systems_data.append(system_data)
 
-    return count
+
+def read_system_dirs(
+    logger: VerboseLogger, archive: ArchiveWrapper, files: list[LogFile]
+) -> Iterator[SystemDirContents]:
+    """Read every system directory's files, one directory at a time.
+
+    The files of READ_BATCH_SIZE directories are extracted at once, then each
+    directory's files are yielded.
+
+    Parameters
+    ----------
+    logger : verboselogs.VerboseLogger
+        The program's logger.
+    archive : stealer_parser.models.archive_wrapper.ArchiveWrapper
+        The archive wrapper.
+    files : list of LogFile
+        The files to read.
+
+    Yields
+    ------
+    SystemDirContents
+        A system directory's files, with their complete path and content.
+
+    Raises
+    ------
+    RuntimeError
+        If the archive was closed.
+    NotImplementedError
+        If the compression method is not supported.
+    rarfile.BadRarFile
+        If failed to read the archive's files.
+
+    """
+    end: int = 0
+
+    while end < len(files):
+        # Find the bounds of the next READ_BATCH_SIZE system directories.
+        bounds: list[int] = [end]
+
+        for _ in range(READ_BATCH_SIZE):
+            if end == len(files):
+                break
+
+            current_dir: str = files[end].system_dir
+
+            while end < len(files) and files[end].system_dir == current_dir:
+                end += 1
+
+            bounds.append(end)
+
+        texts: dict[str, str] | None = None
+        batch_start: int = bounds[0]
+
+        try:
+            texts = archive.read_files(
+                [file.filename for file in files[batch_start:end]]
+            )
+
+        except (CrcError, KeyError, UnicodeDecodeError, ValueError):
+            pass  # Each directory is read on its own to report errors.
+
+        for start, stop in pairwise(bounds):
+            yield read_system_dir(logger, archive, files[start:stop], texts)
+
+
+def _init_worker(name: str, verbosity_level: int) -> None:
+    """Initialize a worker process' logger."""
+    global _worker_logger
+
+    _worker_logger = init_logger(name=name, verbosity_level=verbosity_level)
+
+
+def _parse_system_dir_worker(
+    contents: SystemDirContents,
+) -> SystemData | None:
+    """Parse a system directory's files in a worker process."""
+    return parse_system_dir(_worker_logger, contents)
+
+
+def collect_system_data(leak: Leak, future: Future[SystemData | None]) -> None:
+    """Wait for a worker's parsed system directory and store it.
+
+    Parameters
+    ----------
+    leak : stealer_parser.models.leak.Leak
+        The object to store the leak's metadata and content.
+    future : concurrent.futures.Future of SystemData or None
+        The pending result of _parse_system_dir_worker().
+
+    """
+    system_data: SystemData | None = future.result()
+
+    if system_data:
+        leak.systems_data.append(system_data)
 
 
 def process_archive(
-    logger: VerboseLogger, leak: Leak, archive: ArchiveWrapper
+    logger: VerboseLogger,
+    leak: Leak,
+    archive: ArchiveWrapper,
+    jobs: int = 1,
+    verbosity_level: int = 0,
 ) -> None:
     """Process every system directory in an archive.
 
+    The archive's files are always read by the current process since archive
+    handles can't be shared. With several jobs, system directories are then
+    parsed by a pool of worker processes.
+
     Parameters
     ----------
     logger : verboselogs.VerboseLogger
@@ -264,6 +484,11 @@ def process_archive(
         The object to store the leak's metadata and content.
     archive : stealer_parser.models.archive_wrapper.ArchiveWrapper
         The archive wrapper.
+    jobs : int, default=1
+        The number of processes parsing system directories, 0 for one per
+        CPU.
+    verbosity_level : int, default=0
+        The worker processes' logs verbosity level.
 
     Raises
     ------
@@ -276,11 +501,32 @@ def process_archive(
     logger.info(f"Processing: {archive.filename} ...")
 
     files: list[LogFile] = generate_file_list(archive)
-    index: int = 0
 
     try:
-        while index < len(files):
-            index += process_system_dir(logger, leak, archive, files[index:])
+        if jobs != 1:
+            with ProcessPoolExecutor(
+                max_workers=jobs or None,
+                initializer=_init_worker,
+                initargs=(logger.name, verbosity_level),
+            ) as executor:
+                max_pending: int = PENDING_PER_JOB * (jobs or cpu_count() or 1)
+                pending: deque[Future[SystemData | None]] = deque()
+
+                # Results are collected in submission order.
+                for contents in read_system_dirs(logger, archive, files):
+                    pending.append(
+                        executor.submit(_parse_system_dir_worker, contents)
+                    )
+
+                    if len(pending) >= max_pending:
+                        collect_system_data(leak, pending.popleft())
+
+                while pending:
+                    collect_system_data(leak, pending.popleft())
+
+        else:
+            for contents in read_system_dirs(logger, archive, files):
+                process_system_dir(logger, leak, contents)
 
     except BadRarFile as err:
         raise BadRarFile(f"BadRarFile: {err}") from err
@@ -5,7 +5,7 @@ is an ASCII art banner or a link to a Telegram channel.
 """
 import re
 
-from stealer_parser.models import StealerNameType
+from stealer_parser.models import StealerNameType, is_stealer_name
 
 # ASCII art stealers signatures
 DCRAT_HEADER: str = (
@@ -66,6 +66,40 @@ STEALC_HEADER: str = (
     "  \\/_____/     \\/_/   \\/_____/   \\/_/\\/_/   \\/_____/   \\/_____/\n"
 )
 
+# The signatures with their stealer name, searched in this order.
+NAMED_HEADERS: tuple[tuple[StealerNameType, str], ...] = (
+    ("redline", REDLINE_HEADER),
+    ("redline", REDLINE_HEADER_MALFORMED),
+    ("stealc", STEALC_HEADER),
+    ("meta", META_HEADER),
+    ("raccoon", RACCOON_HEADER),
+    ("dcrat", DCRAT_HEADER),
+)
+
+# The signatures with their Windows line endings variant.
+STEALER_HEADERS: tuple[tuple[StealerNameType, str, str], ...] = tuple(
+    (name, header, header.replace("\n", "\r\n"))
+    for name, header in NAMED_HEADERS
+)
+
+# Search Redline first because it occurs the most.
+STEALER_NAME_REGEX: str = (
+    r"(?i)(?=[lrs])\b(redline|stealc|raccoon|lummac2)([^a-zA-Z]|\b)"
+)
+# Let's break down this regex:
+#
+# (?i)    Case insensitive
+# (?=[lrs])
+#         Assert the next character starts a stealer name, which skips most
+#         positions before checking the word boundary and the names.
+# \b      Assert position at a word boundary: (^\w|\w$|\W\w|\w\W)
+# (redline|stealc|raccoon|lummac2)
+#         Match exact stealer name.
+# ([^a-zA-Z]|\b)
+#         Stealer name is followed by non-alphabetic characters or word
+#         boundary.
+STEALER_NAME_PATTERN: re.Pattern[str] = re.compile(STEALER_NAME_REGEX)
+
 
 def search_stealer_name(text: str) -> StealerNameType | None:
     """Parse text file to find stealer name.
@@ -81,39 +115,21 @@ def search_stealer_name(text: str) -> StealerNameType | None:
         The lowercase infostealer name if found. Otherwise, None.
 
     """
-    # Search Redline first because it occurs the most.
-    stealer_regex: str = (
-        r"(?i)\b(redline|stealc|raccoon|lummac2)([^a-zA-Z]|\b)"
-    )
-    # Let's break down this regex:
-    #
-    # (?i)    Case insensitive
-    # \b      Assert position at a word boundary: (^\w|\w$|\W\w|\w\W)
-    # (redline|stealc|raccoon|lummac2)
-    #         Match exact stealer name.
-    # ([^a-zA-Z]|\b)
-    #         Stealer name is followed by non-alphabetic characters or word
-    #         boundary.
-    matched: re.Match[str] | None = re.search(stealer_regex, text)
+    matched: re.Match[str] | None = STEALER_NAME_PATTERN.search(text)
 
     if matched:
-        return matched.group(1).lower()  # type: ignore
-
-    clean_text: str = text.replace("\r\n", "\n")
-
-    if REDLINE_HEADER in clean_text or REDLINE_HEADER_MALFORMED in clean_text:
-        return "redline"
-
-    if STEALC_HEADER in clean_text:
-        return "stealc"
+        matched_name: str = matched.group(1).lower()
 
-    if META_HEADER in clean_text:
-        return "meta"
+        # Unicode look-alikes such as "ſtealc" match case-insensitively.
+        if is_stealer_name(matched_name):
+            return matched_name
 
-    if RACCOON_HEADER in clean_text:
-        return "raccoon"
+    # Windows line endings are searched as is rather than normalized, which
+    # would copy the whole text.
+    has_crlf: bool = "\r\n" in text
 
-    if DCRAT_HEADER in clean_text:
-        return "dcrat"
+    for name, header, header_crlf in STEALER_HEADERS:
+        if header in text or (has_crlf and header_crlf in text):
+            return name
 
     return None